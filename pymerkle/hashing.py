@@ -86,9 +86,11 @@ class HashEngine:
             self.prefx00 = bytes()
             self.prefx01 = bytes()
 
+        self._new_hasher = getattr(hashlib, self.algorithm)
+
     def _load_hasher(self):
 
-        return getattr(hashlib, self.algorithm)()
+        return self._new_hasher(self.prefx00)
 
     def hash_data(self, data):
         """
@@ -102,17 +104,7 @@ class HashEngine:
         buff = self.prefx00 + (data if isinstance(data, bytes) else
                                data.encode(self.encoding))
 
-        hasher = self._load_hasher()
-        update = hasher.update
-        offset = 0
-        chunksize = 1024
-        chunk = buff[offset: chunksize]
-        while chunk:
-            update(chunk)
-            offset += chunksize
-            chunk = buff[offset: offset + chunksize]
-
-        return hasher.hexdigest().encode(self.encoding)
+        return self._new_hasher(buff).hexdigest().encode(self.encoding)
 
     def hash_file(self, filepath):
         """
@@ -128,7 +120,6 @@ class HashEngine:
         hasher = self._load_hasher()
         chunksize = 1024
         update = hasher.update
-        update(self.prefx00)
         with open(os.path.abspath(filepath), mode='rb') as f:
 
             with contextlib.closing(
@@ -161,13 +152,31 @@ class HashEngine:
         :type right: bytes
         :rtype: bytes
         """
-        buff = self.prefx01 + left + self.prefx01 + right
-
-        hasher = self._load_hasher()
-        hasher.update(buff)
+        prefx01 = self.prefx01
+        hasher = self._new_hasher(prefx01 + left + prefx01 + right)
 
         return hasher.hexdigest().encode(self.encoding)
 
+    def hash_pairs_batch(self, pairs):
+        """
+        Computes the digests of the provided pairs of bytestrings at once, as
+        *hash_pair()* would do for each one of them separately.
+
+        .. note:: This is intended for hashing an entire level of the tree in
+            one pass, so that the per-pair overhead of *hash_pair()* is paid
+            once per level.
+
+        :param pairs: pairs of left and right sequences
+        :type pairs: iterable of (bytes, bytes)
+        :rtype: list of bytes
+        """
+        hasher = self._new_hasher
+        prefx01 = self.prefx01
+        encoding = self.encoding
+
+        return [hasher(prefx01 + left + prefx01 + right).hexdigest().encode(encoding)
+                for (left, right) in pairs]
+
     def hash_path(self, path, offset):
         """
         Computes the digest occuring after repeatedly applying *hash_pair()*
@@ -192,38 +201,46 @@ class HashEngine:
 
         :raises EmptyPathException: if the provided path of hashes is empty.
         """
-        path = list(path)
-
-        if not path:
+        # Fold over parallel sequences of signs and hashes, split in one pass
+        signs = []
+        hashes = []
+        for (sign, value) in path:
+            signs.append(sign)
+            hashes.append(value)
+
+        if not hashes:
             raise EmptyPathException
-        elif len(path) == 1:
-            return path[0][1]
+        elif len(hashes) == 1:
+            return hashes[0]
 
+        hash_pair = self.hash_pair
         i = offset
-        while len(path) > 1:
+        while len(hashes) > 1:
 
-            if path[i][0] == +1:
+            if signs[i] == +1:
 
                 # Pair with the right neighbour
                 if i != 0:
-                    sign = path[i + 1][0]
+                    sign = signs[i + 1]
                 else:
                     sign = +1
 
-                digest = self.hash_pair(path[i][1], path[i + 1][1])
+                digest = hash_pair(hashes[i], hashes[i + 1])
                 move = +1
             else:
 
                 # Pair with left neighbour
-                sign = path[i - 1][0]
-                digest = self.hash_pair(path[i - 1][1], path[i][1])
+                sign = signs[i - 1]
+                digest = hash_pair(hashes[i - 1], hashes[i])
                 move = -1
 
-            path[i] = (sign, digest)
+            signs[i] = sign
+            hashes[i] = digest
 
             # Shrink
-            del path[i + move]
+            del signs[i + move]
+            del hashes[i + move]
             if move < 0:
                 i -= 1
 
-        return path[0][1]
+        return hashes[0]
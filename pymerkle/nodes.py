@@ -3,6 +3,7 @@ Provides nodes for the Merkle-tree data structure.
 """
 
 from abc import ABCMeta, abstractmethod
+from operator import attrgetter
 import json
 
 
@@ -38,61 +39,61 @@ class Node:
     :rtype: Node
     """
 
-    __slots__ = ('__value', '__parent', '__left', '__right')
+    __slots__ = ('_value', '_parent', '_left', '_right', '_side',
+                 '_checksum')
 
     def __init__(self, value, parent=None, left=None, right=None):
-        self.__value = value
-        self.__parent = parent
-        self.__left = left
-        self.__right = right
+        self._value = value
+        self._parent = parent
+        self._left = left
+        self._right = right
+
+        # Side with respect to parent: 0 for left, 1 for right child
+        self._side = None
+
+        # Decoded value along with its encoding, computed upon first request
+        self._checksum = None
 
         if left:
-            left.__parent = self
+            left._parent = self
+            left._side = 0
         if right:
-            right.__parent = self
+            right._parent = self
+            right._side = 1
 
-    @property
-    def value(self):
-        """
+    # Read-only accessors resolved by C-level getters, i.e., without a
+    # Python call per access
+
+    value = property(attrgetter('_value'), doc="""
         The digest currently stored by the node.
 
         :rtype: bytes
-        """
-        return self.__value
+        """)
 
-    @property
-    def left(self):
-        """
+    left = property(attrgetter('_left'), doc="""
         The left child of the node.
 
         .. note:: Rerturns *None* if the node has no left child.
 
         :rtype: Node
-        """
-        return self.__left
+        """)
 
-    @property
-    def right(self):
-        """
+    right = property(attrgetter('_right'), doc="""
         The right child of the node.
 
         .. note:: Rerturns *None* if the node has no right child.
 
         :rtype: Node
-        """
-        return self.__right
+        """)
 
-    @property
-    def parent(self):
-        """
+    parent = property(attrgetter('_parent'), doc="""
         The parent of the node.
 
         .. note:: Rerturns *None* if the node has no parent.
         .. attention:: A prentless node is the root of the containing tree.
 
         :rtype: Node
-        """
-        return self.__parent
+        """)
 
     def set_left(self, node):
         """
@@ -101,7 +102,10 @@ class Node:
         :param left: the new left child
         :type left: Node
         """
-        self.__left = node
+        self._left = node
+
+        if node:
+            node._side = 0
 
     def set_right(self, node):
         """
@@ -110,7 +114,10 @@ class Node:
         :param right: the new right child
         :type right: Node
         """
-        self.__right = node
+        self._right = node
+
+        if node:
+            node._side = 1
 
     def set_parent(self, node):
         """
@@ -119,7 +126,7 @@ class Node:
         :param parent: the new parent
         :type parent: Node
         """
-        self.__parent = node
+        self._parent = node
 
     def is_left_child(self):
         """
@@ -128,11 +135,7 @@ class Node:
 
         :rtype: bool
         """
-        parent = self.__parent
-        if not parent:
-            return False
-
-        return self == parent.left
+        return self._side == 0 and self._parent is not None
 
     def is_right_child(self):
         """
@@ -141,11 +144,7 @@ class Node:
 
         :rtype: bool
         """
-        parent = self.__parent
-        if not parent:
-            return False
-
-        return self == parent.right
+        return self._side == 1 and self._parent is not None
 
     def is_leaf(self):
         """
@@ -165,8 +164,18 @@ class Node:
         :type encoding: str
 
         :rtype: str
+
+        .. note:: The result is cached along with the requested encoding until
+            the node's hash is recalculated.
         """
-        return self.value.decode(encoding)
+        cached = self._checksum
+        if cached is not None and cached[0] == encoding:
+            return cached[1]
+
+        checksum = self._value.decode(encoding)
+        self._checksum = (encoding, checksum)
+
+        return checksum
 
     @classmethod
     def from_children(cls, left, right, engine):
@@ -186,16 +195,66 @@ class Node:
         .. note:: No parent is specified during construction. Relation must be
             set afterwards.
         """
-        digest = engine.hash_pair(left.__value, right.__value)
+        digest = engine.hash_pair(left._value, right._value)
 
-        return cls(value=digest, left=left, right=right, parent=None)
+        return cls._unchecked(digest, left, right)
+
+    @classmethod
+    def from_children_batch(cls, pairs, engine):
+        """
+        Construction of nodes from a given sequence of pairs of nodes, with
+        all digests computed in a single pass.
+
+        :param pairs: pairs of left and right children
+        :type pairs: list of (Node, Node)
+        :param engine: hash-engine to be used for digest computation
+        :type engine: HashEngine
+        :returns: nodes storing the digests of the concatenations of the
+            provided pairs' digests, in respective order.
+        :rtype: list of Node
+
+        .. note:: No parent is specified during construction. Relation must be
+            set afterwards.
+        """
+        digests = engine.hash_pairs_batch(
+            [(left._value, right._value) for (left, right) in pairs])
+
+        unchecked = cls._unchecked
+
+        return [unchecked(digest, left, right)
+                for (digest, (left, right)) in zip(digests, pairs)]
+
+    @classmethod
+    def _unchecked(cls, value, left, right):
+        """
+        Parentless node with both children present, created by direct slot
+        assignment.
+
+        .. note:: Skips the argument handling and child checks of
+            *__init__()*; both children must be provided.
+        """
+        node = cls.__new__(cls)
+        node._value = value
+        node._parent = None
+        node._left = left
+        node._right = right
+        node._side = None
+        node._checksum = None
+
+        left._parent = node
+        left._side = 0
+        right._parent = node
+        right._side = 1
+
+        return node
 
     def ancestor(self, degree):
         """
         Detects and returns the node that is *degree* steps upwards within
         the containing tree.
 
-        .. note:: Returns *None* if the requested degree exceeds possibilities.
+        .. note:: Returns *None* if the requested degree exceeds possibilities
+            or is negative.
 
         .. note:: Ancestor of degree 0 is the node itself, ancestor of degree
             1 is the node's parent, etc.
@@ -205,13 +264,19 @@ class Node:
         :returns: the ancestor corresdponding to the requested degree
         :rtype: Node
         """
-        if degree == 0:
-            return self
-
-        if not self.__parent:
+        if degree < 0:
             return
 
-        return self.__parent.ancestor(degree - 1)
+        node = self
+        while degree > 0:
+            node = node._parent
+
+            if not node:
+                return
+
+            degree -= 1
+
+        return node
 
     def recalculate_hash(self, engine):
         """
@@ -221,7 +286,8 @@ class Node:
         :param engine: hash-engine to be used for digest computation
         :type engine: HashEngine
         """
-        self.__value = engine.hash_pair(self.left.value, self.right.value)
+        self._value = engine.hash_pair(self._left._value, self._right._value)
+        self._checksum = None
 
     def __str__(self, encoding, level=0, indent=3, ignored=None):
         """
@@ -232,53 +298,70 @@ class Node:
         :param encoding: encoding type of the containing tree.
         :type encoding: str
         :param level: [optional] Defaults to 0. Must be left equal to the
-            default value when called externally by the user. Increased by
-            1 whenever the function is recursively called in order to keep
-            track of depth while printing.
+            default value when called externally by the user. Depth at
+            which the present node is printed; increased by 1 for each level
+            descended in order to keep track of depth while printing.
         :type level: int
         :param indent: [optional] Defaults to 3. The horizontal depth at which
             each level of the tree will be indented with respect to the
             previous one.
         :type indent: int
         :param ignored: [optional] Defaults to empty. Must be left equal to the
-            *default* value when called externally by the user. Augmented
-            appropriately whenever the function is recursively invoked in order
-            to keep track of where vertical bars should be omitted.
+            *default* value when called externally by the user. Levels at
+            which vertical bars should be omitted; further levels are tracked
+            internally while descending the subtree.
         :type ignored: list
         :rtype: str
 
         .. note:: Left children appear above the right ones.
         """
-        if level == 0:
-            out = '\n'
-            if not self.is_left_child() and not self.is_right_child():
-                out += f' {L_BRACKET_SHORT}'
-        else:
-            out = (indent + 1) * ' '
-
-        count = 1
-        if ignored is None:
-            ignored = []
-        while count < level:
-            out += f' {VERTICAL_BAR}' if count not in ignored else 2 * ' '
-            out += indent * ' '
-            count += 1
-
-        if self.is_left_child():
-            out += f' {T_BRACKET}'
-        if self.is_right_child():
-            out += f' {L_BRACKET_LONG}'
-            ignored.append(level)
-
-        checksum = self.get_checksum(encoding)
-        out += f'{checksum}\n'
-
-        if not self.is_leaf():
-            args = (encoding, level + 1, indent, ignored)
-            out += self.left.__str__(*args)
-            out += self.right.__str__(*args)
-
-        return out
+        # Levels where vertical bars are omitted, kept as bitmask
+        ignored_mask = 0
+        for count in ignored or ():
+            ignored_mask |= 1 << count
+
+        out = []
+        append = out.append
+        bar = f' {VERTICAL_BAR}' + indent * ' '
+        blank = (indent + 2) * ' '
+        margin = (indent + 1) * ' '
+
+        # Line prefixes by level and ignored levels above it, built once
+        prefixes = {}
+
+        # Pre-order traversal with explicit stack; left children are popped
+        # before the right ones
+        stack = [(self, level)]
+        while stack:
+            node, level = stack.pop()
+
+            if level == 0:
+                append('\n')
+                if not node.is_left_child() and not node.is_right_child():
+                    append(f' {L_BRACKET_SHORT}')
+            else:
+                key = (level, ignored_mask & ((1 << level) - 2))
+                prefix = prefixes.get(key)
+                if prefix is None:
+                    prefix = prefixes[key] = margin + ''.join(
+                        blank if ignored_mask >> count & 1 else bar
+                        for count in range(1, level))
+                append(prefix)
+
+            if node.is_left_child():
+                append(f' {T_BRACKET}')
+            if node.is_right_child():
+                append(f' {L_BRACKET_LONG}')
+                ignored_mask |= 1 << level
+
+            checksum = node.get_checksum(encoding)
+            append(f'{checksum}\n')
+
+            if not node.is_leaf():
+                stack.append((node.right, level + 1))
+                stack.append((node.left, level + 1))
+
+        return ''.join(out)
 
     def serialize(self, encoding):
         """
@@ -291,13 +374,19 @@ class Node:
         .. note:: The *parent* attribute is ommited from node serialization in
             order for circular reference error to be avoided.
         """
-        out = {'hash': self.get_checksum(encoding)}
+        out = {}
+
+        stack = [(self, out)]
+        while stack:
+            node, serialized = stack.pop()
 
-        if self.left:
-            out.update({'left': self.left.serialize(encoding)})
+            # Keys in alphabetical order, so that JSON texts need no sorting
+            serialized['hash'] = node.get_checksum(encoding)
 
-        if self.right:
-            out.update({'right': self.right.serialize(encoding)})
+            for (key, child) in (('left', node.left), ('right', node.right)):
+                if child:
+                    serialized[key] = {}
+                    stack.append((child, serialized[key]))
 
         return out
 
@@ -312,7 +401,7 @@ class Node:
         .. note:: The *parent* attribute is ommited from node serialization in
             order for circular reference error to be avoided.
         """
-        return json.dumps(self.serialize(encoding), sort_keys=True, indent=indent)
+        return json.dumps(self.serialize(encoding), indent=indent)
 
 
 class Leaf(Node):
@@ -326,18 +415,22 @@ class Leaf(Node):
     :rtype: Leaf
     """
 
-    __slots__ = ('__next',)
+    __slots__ = ('_next',)
 
     def __init__(self, value, leaf=None):
-        self.__next = leaf
+        self._next = leaf
         super().__init__(value)
 
-    @property
-    def next(self):
-        return self.__next
+    next = property(attrgetter('_next'), doc="""
+        The next leaf of the containing tree.
+
+        .. note:: Returns *None* if this is the last leaf.
+
+        :rtype: Leaf
+        """)
 
     def set_next(self, leaf):
-        self.__next = leaf
+        self._next = leaf
 
     @classmethod
     def from_data(cls, data, engine):
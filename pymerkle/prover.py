@@ -4,8 +4,14 @@ Provides the Merkle-proof object.
 
 import os
 import json
+from functools import lru_cache
 from time import time, ctime
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from pymerkle.hashing import HashEngine
 from pymerkle.utils import log10, generate_uuid
 
@@ -50,19 +56,31 @@ def stringify_path(path, encoding):
     :rtype: str
     """
     pairs = []
-    pair_template = '\n{left}[{index}]{middle}{sign}{right}{value}'
-    for index, curr in enumerate(path):
-        pairs.append(
-            pair_template.format(left=(7 - _order_of_magnitude(index)) * ' ',
-                                 index=index,
-                                 middle=3 * ' ',
-                                 sign=_get_signed(curr[0]),
-                                 right=3 * ' ',
-                                 value=curr[1].decode(encoding) if not isinstance(curr[1], str)
-                                 else curr[1]))
+    append = pairs.append
+    for index, (sign, value) in enumerate(path):
+        left = (7 - _order_of_magnitude(index)) * ' '
+        checksum = value if isinstance(value, str) else value.decode(encoding)
+        append(f'\n{left}[{index}]   {_get_signed(sign)}   {checksum}')
+
     return ''.join(pairs)
 
 
+@lru_cache(maxsize=4096)
+def _compute_checksum(algorithm, encoding, security, offset, path):
+    """
+    Memoized computation of the hash value resulting from the provided path
+    of hashes under the provided verification parameters.
+
+    :param path: path of hashes
+    :type path: tuple of (+1/-1, bytes)
+    :rtype: bytes
+    """
+    engine = HashEngine(algorithm=algorithm, encoding=encoding,
+                        security=security)
+
+    return engine.hash_path(path, offset)
+
+
 class InvalidProof(Exception):
     """
     Raised when a Merkle-proof is found to be invalid.
@@ -88,7 +106,7 @@ class Proof:
                  timestamp=None, created_at=None, commitment=None):
         self.uuid = uuid or generate_uuid()
         self.timestamp = timestamp or int(time())
-        self.created_at = created_at or ctime()
+        self.created_at = created_at or ctime(self.timestamp)
         self.algorithm = algorithm
         self.encoding = encoding
         self.security = security
@@ -109,12 +127,16 @@ class Proof:
         """
         Computes the hash value resulting from the proof's path of hashes.
 
+        .. note:: Results are memoized by the proof's verification parameters,
+            offset and path, so that re-verifying the same proof does not
+            repeat the hashing.
+
         :rtype: bytes
         """
-        engine = HashEngine(**self.get_verification_params())
-        checksum = engine.hash_path(self.path, self.offset)
+        path = tuple(map(tuple, self.path))
 
-        return checksum
+        return _compute_checksum(self.algorithm, self.encoding, self.security,
+                                 self.offset, path)
 
     def verify(self, target=None):
         """
@@ -216,8 +238,8 @@ class Proof:
         body = proof['body']
         kw['offset'] = body['offset']
         encoding = header['encoding']
-        kw['path'] = [(pair[0], pair[1].encode(encoding)) for pair in
-                body['path']]
+        kw['path'] = [(sign, checksum.encode(encoding)) for (sign, checksum)
+                      in body['path']]
         commitment = body.get('commitment', None)
         if commitment:
             kw['commitment'] = commitment.encode()
@@ -239,7 +261,7 @@ class Proof:
         :param text: serialized proof as JSON text.
         :type text: str
         """
-        return cls.from_dict(json.loads(text))
+        return cls.from_dict(_json_loads(text))
 
     @classmethod
     def deserialize(cls, serialized):
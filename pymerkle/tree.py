@@ -96,8 +96,7 @@ class BaseMerkleTree(HashEngine, metaclass=ABCMeta):
         config = {} if not config else config
         tree = cls(**config)
 
-        for record in data:
-            tree.encrypt(record)
+        tree.add_leaves([Leaf.from_data(record, tree) for record in data])
 
         return tree
 
@@ -161,6 +160,18 @@ class BaseMerkleTree(HashEngine, metaclass=ABCMeta):
         Define here the tree's growing strategy.
         """
 
+    def add_leaves(self, leaves):
+        """
+        Inserts the provided leaves to the tree in respective order.
+
+        .. note:: Override this in order to exploit bulk insertion.
+
+        :param leaves: leaf nodes to append
+        :type leaves: iterable of Leaf
+        """
+        for leaf in leaves:
+            self.add_leaf(leaf)
+
     @abstractmethod
     def generate_audit_path(self, leaf):
         """
@@ -410,7 +421,9 @@ class BaseMerkleTree(HashEngine, metaclass=ABCMeta):
         encoding = self.encoding
         hashes = [leaf.get_checksum(encoding) for leaf in self.get_leaves()]
 
-        return {**self.get_config(), 'hashes': hashes}
+        # Keys in alphabetical order, so that JSON texts need no sorting
+        return {'algorithm': self.algorithm, 'encoding': encoding,
+                'hashes': hashes, 'security': self.security}
 
     def toJSONText(self, indent=4):
         """
@@ -422,7 +435,7 @@ class BaseMerkleTree(HashEngine, metaclass=ABCMeta):
 
         :rtype: str
         """
-        return json.dumps(self.serialize(), sort_keys=True, indent=indent)
+        return json.dumps(self.serialize(), indent=indent)
 
     def export(self, filepath, indent=4):
         """
@@ -459,14 +472,17 @@ class BaseMerkleTree(HashEngine, metaclass=ABCMeta):
 
         nr_hashes = len(hashes)
         sys.stdout.write('\nLoaded file content\n')
+        leaves = []
         for count, checksum in enumerate(hashes):
 
             value = checksum.encode(tree.encoding)
-            tree.add_leaf(Leaf(value=value))
+            leaves.append(Leaf(value=value))
 
             sys.stdout.write('%d/%d leaves\r' % (count + 1, nr_hashes))
             sys.stdout.flush()
 
+        tree.add_leaves(leaves)
+
         return tree
 
 
@@ -487,8 +503,7 @@ class MerkleTree(BaseMerkleTree):
 
     def __init__(self, algorithm='sha256', encoding='utf-8', security=True):
         self.__root = None
-        self.__head = None
-        self.__tail = None
+        self.__leaves = []
         self.__nr_leaves = 0
 
         super().__init__(algorithm, encoding, security)
@@ -547,7 +562,7 @@ class MerkleTree(BaseMerkleTree):
         if nr_leaves == 0:
             return 0
 
-        if nr_leaves != 2 ** log_2(nr_leaves):
+        if nr_leaves != 1 << log_2(nr_leaves):
             return log_2(nr_leaves + 1)
 
         return log_2(nr_leaves)
@@ -583,10 +598,7 @@ class MerkleTree(BaseMerkleTree):
 
         :returns: generator of the tree's current leaf nodes
         """
-        curr = self.__head
-        while curr:
-            yield curr
-            curr = curr.next
+        yield from self.__leaves
 
     def get_leaf(self, offset):
         """
@@ -600,16 +612,10 @@ class MerkleTree(BaseMerkleTree):
         :returns: leaf at provided position
         :rtype: Leaf
         """
-        if offset < 0:
+        if offset < 0 or offset >= self.__nr_leaves:
             return
 
-        curr = self.__head
-        j = 0
-        while j < offset and curr:
-            curr = curr.next
-            j += 1
-
-        return curr
+        return self.__leaves[offset]
 
     def get_tail(self):
         """
@@ -618,7 +624,10 @@ class MerkleTree(BaseMerkleTree):
 
         .. note:: Returns *None* if the tree is emtpy.
         """
-        return self.__tail
+        if not self.__leaves:
+            return
+
+        return self.__leaves[-1]
 
     def _append_leaf(self, leaf):
         """
@@ -627,14 +636,11 @@ class MerkleTree(BaseMerkleTree):
         :param leaf: leaf node to append
         :type leaf: Leaf
         """
-        if self.__tail:
-            self.__tail.set_next(leaf)
-
-        self.__tail = leaf
-
-        if not self.__head:
-            self.__head = leaf
+        leaves = self.__leaves
+        if leaves:
+            leaves[-1].set_next(leaf)
 
+        leaves.append(leaf)
         self.__nr_leaves += 1
 
     def add_leaf(self, leaf):
@@ -674,6 +680,43 @@ class MerkleTree(BaseMerkleTree):
             self._append_leaf(leaf)
             self.__root = leaf
 
+    def add_leaves(self, leaves):
+        """
+        Inserts the provided leaves to the tree in respective order.
+
+        .. note:: If the tree is empty, it is built level by level with all
+            digests of each level computed in a single pass; the resulting
+            structure coincides with the one produced by successive
+            *add_leaf()* calls. Otherwise, leaves are appended one by one.
+
+        :param leaves: leaf nodes to append
+        :type leaves: iterable of Leaf
+        """
+        if self:
+            super().add_leaves(leaves)
+            return
+
+        level = []
+        for leaf in leaves:
+            self._append_leaf(leaf)
+            level.append(leaf)
+
+        if not level:
+            return
+
+        from_children_batch = Node.from_children_batch
+        while len(level) > 1:
+            parents = from_children_batch(list(zip(level[::2], level[1::2])),
+                                          self)
+
+            # Odd node is carried over to the next level
+            if len(level) % 2:
+                parents.append(level[-1])
+
+            level = parents
+
+        self.__root = level[0]
+
     def generate_audit_path(self, leaf):
         """
         Computes the audit-path based on the provided leaf node.
@@ -847,7 +890,10 @@ class MerkleTree(BaseMerkleTree):
         Returns the root of the *full* binary subtree with maximum possible
         length containing the rightmost leaf
         """
-        last_power = decompose(self.__nr_leaves)[-1]
+        nr_leaves = self.__nr_leaves
+
+        # Smallest power of 2 in the decomposition of the current length
+        last_power = (nr_leaves & -nr_leaves).bit_length() - 1
 
         return self.get_tail().ancestor(degree=last_power)
 
@@ -889,7 +935,7 @@ class MerkleTree(BaseMerkleTree):
                 sign = +1 if parent.is_left_child() else -1
 
             principals.append((sign, subroot))
-            offset += 2 ** height
+            offset += 1 << height
 
         if principals:
             # Modify last sign
@@ -2,16 +2,16 @@
 Utilities
 """
 
-from math import log, log10
+from math import log10
 import uuid
 
 
 def generate_uuid():
     """
-    :returns: UUID1 universal identifier
+    :returns: UUID4 universal identifier
     :rtype: str
     """
-    return str(uuid.uuid1())
+    return str(uuid.uuid4())
 
 
 def log_2(num):
@@ -32,7 +32,10 @@ def log_2(num):
 
     :raises ValueError: for arguments smaller than zero
     """
-    return int(log(num, 2)) if num != 0 else 0
+    if num < 0:
+        raise ValueError('math domain error')
+
+    return num.bit_length() - 1 if num != 0 else 0
 
 
 def decompose(num):
@@ -63,7 +66,7 @@ def decompose(num):
     """
     powers = []
     while num > 0:
-        power = log_2(num)
-        powers += [power]
-        num -= 2 ** power
+        power = num.bit_length() - 1
+        powers.append(power)
+        num ^= 1 << power
     return powers
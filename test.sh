@@ -5,7 +5,8 @@ usage_string="usage: ./$(basename "$0") [pytest_options] [--extended]
 Options
   --extended  If provided, tests run against all combinations of hash type,
               encoding type and security mode; otherwise only against the
-              encodings UTF-8, UTF-16 and UTF-32.
+              encodings UTF-8, UTF-16 and UTF-32 and, for hashing and proof
+              generation, the hash types SHA256 and SHA3-256.
   -h, --help  Display help message and exit
 "
 
@@ -37,4 +38,4 @@ python3 -m \
   pytest tests/ \
   --cov-report term-missing \
   --cov=. \
-  $args
+  "${args[@]}"
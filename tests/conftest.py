@@ -1,6 +1,7 @@
 def pytest_addoption(parser):
     parser.addoption('--extended', action='store_true', default=False,
-                     help='Test against all supported encoding types')
+                     help='Test against all supported encoding types and '
+                     'hash algorithms')
 
 
 def resolve_encodings(option):
@@ -12,8 +13,26 @@ def resolve_encodings(option):
     return ['utf-8', 'utf-16', 'utf-32']
 
 
+def resolve_algorithms(option):
+    from pymerkle.hashing import SUPPORTED_ALGORITHMS
+
+    if option.extended:
+        return SUPPORTED_ALGORITHMS
+
+    return ['sha256', 'sha3_256']
+
+
+def normalize_encoding(encoding):
+    # Encoding name as stored by hash-engines and trees
+    return encoding.lower().replace('-', '_')
+
+
 option = None
 
 def pytest_configure(config):
     global option
     option = config.option
+
+    # Provided by pytest-xdist, registered here in case it is not installed
+    config.addinivalue_line('markers', 'xdist_group(name): group tests '
+                            'to run on the same worker under --dist loadgroup')
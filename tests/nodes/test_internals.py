@@ -113,6 +113,12 @@ def test_no_ancestor_exception(node, degree):
     assert not node.ancestor(degree=degree)
 
 
+@pytest.mark.parametrize('node', (l1, l2, l3, l4,
+                                  n1, n3, root))
+def test_negative_degree_ancestor(node):
+    assert node.ancestor(degree=-1) is None
+
+
 @pytest.mark.parametrize('node', (l1, l2, l3, l4,
                                   n1, n3, root))
 def test_zero_degree_ancestor(node):
@@ -141,3 +147,54 @@ def test_hash_recalculation():
         n3.value == engine.hash_pair(l3.value, new_leaf.value),
         root.value == engine.hash_pair(n1.value, n3.value),
     ))
+
+
+def test_from_children_batch():
+    left, right = Leaf.from_data(b'a', engine), Leaf.from_data(b'b', engine)
+    other_left, other_right = Leaf.from_data(b'c', engine), \
+        Leaf.from_data(b'd', engine)
+    nodes = Node.from_children_batch(((left, right),
+                                      (other_left, other_right)), engine)
+    assert [node.value for node in nodes] == [
+        engine.hash_pair(left.value, right.value),
+        engine.hash_pair(other_left.value, other_right.value),
+    ] and all((
+        left.parent is right.parent is nodes[0],
+        other_left.parent is other_right.parent is nodes[1],
+        nodes[0].left is left and nodes[0].right is right,
+    ))
+
+
+def test_deep_ancestor():
+    curr = bottom = Leaf.from_data(b'bottom', engine)
+    for _ in range(5000):
+        curr = Node.from_children(curr, Leaf.from_data(b'x', engine), engine)
+    assert bottom.ancestor(degree=5000) is curr and \
+        not bottom.ancestor(degree=5001)
+
+
+def test_side_after_reassignment():
+    parent = Node.from_children(Leaf.from_data(b'a', engine),
+                                Leaf.from_data(b'b', engine), engine)
+    child = Node.from_children(Leaf.from_data(b'c', engine),
+                               Leaf.from_data(b'd', engine), engine)
+    parent.set_right(child)
+    child.set_parent(parent)
+    assert child.is_right_child() and not child.is_left_child()
+
+
+def test_checksum_after_hash_recalculation():
+    node = Node.from_children(Leaf.from_data(b'a', engine),
+                              Leaf.from_data(b'b', engine), engine)
+    node.get_checksum(engine.encoding)
+    node.set_right(Leaf.from_data(b'c', engine))
+    node.recalculate_hash(engine)
+    assert node.get_checksum(engine.encoding) == \
+        node.value.decode(engine.encoding)
+
+
+def test_checksum_under_another_encoding():
+    node = Leaf(b'\xff\xfea\x00', leaf=None)
+    assert node.get_checksum('utf_16') == 'a'
+    assert node.get_checksum('latin_1') == '\xff\xfea\x00'
+    assert node.get_checksum('utf_16') == 'a'
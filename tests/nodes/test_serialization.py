@@ -140,3 +140,16 @@ def test_node_serialization(node, serialization):
 @pytest.mark.parametrize('node, serialized', serializations)
 def test_node_toJSONtext(node, serialized):
     assert node.toJSONtext(encoding) == json.dumps(serialized, indent=4, sort_keys=True)
+
+
+def test_deep_node_serialization_and_stringification():
+    curr = Leaf.from_data(b'bottom', engine)
+    for _ in range(3000):
+        curr = Node.from_children(curr, Leaf.from_data(b'x', engine), engine)
+    serialized = curr.serialize(encoding)
+    depth = 0
+    while 'left' in serialized:
+        serialized = serialized['left']
+        depth += 1
+    assert depth == 3000 and \
+        curr.__str__(encoding).count('\n') == 2 * 3000 + 2
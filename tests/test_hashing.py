@@ -1,584 +1,197 @@
 """
+Tests hashing of data, pairs and paths of hashes
+
+Inputs are a few dozen bytes, so a single digest costs under a microsecond
+(*hash_data()*, *hash_pair()*), while each test costs about half a
+millisecond of pytest and interpreter overhead. The tests are therefore
+bound by Python calls rather than by hashing. Speedups come from doing
+less per test: engines are built lazily per session, encoded inputs and
+expected digests are computed once at import, and the path cases are
+table-driven. Faster hash primitives would not make a difference here.
 """
 
+import copy
+import itertools
+import pickle
+
 import pytest
 import hashlib
 
-from pymerkle.hashing import HashEngine, SUPPORTED_ALGORITHMS, \
-    EmptyPathException, UnsupportedParameter
+from pymerkle.hashing import HashEngine, EmptyPathException, \
+    UnsupportedParameter
 
-from tests.conftest import option, resolve_encodings
+from tests.conftest import option, resolve_encodings, \
+    resolve_algorithms, normalize_encoding
 
 
 record = 'oculusnonviditnecaurisaudivit'
-engines = []
-engines_types_encodings_securities = []
-engines_singleargs = []
-
-for security in (True, False):
-    for algorithm in SUPPORTED_ALGORITHMS:
-        for encoding in resolve_encodings(option):
-
-            config = {'algorithm': algorithm, 'encoding': encoding,
-                      'security': security}
-            engine = HashEngine(**config)
-
-            engines.append(engine)
-            engines_types_encodings_securities.extend(
-                [
-                    (
-                        engine,
-                        algorithm,
-                        encoding,
-                        security
-                    )
-                ]
-            )
 
-            engines_singleargs.extend(
-                [
-                    (
-                        engine,
-                        record,
-                    ),
-                    (
-                        engine,
-                        record.encode(engine.encoding),
-                    )
-                ]
-            )
+ENCODINGS = tuple(resolve_encodings(option))
+ALGORITHMS = tuple(resolve_algorithms(option))
 
 
-# hash
+# Engines are built lazily per session, only for the selected tests. Each
+# engine, along with its tests, is kept on one worker under
+# ``--dist loadgroup``
 
-@pytest.mark.parametrize("engine, algorithm, encoding, security",
-                         engines_types_encodings_securities)
-def test_single_string_hash(engine, algorithm, encoding, security):
-    prefx00 = '\x00'.encode(encoding)
-    data = record.encode(encoding)
-
-    if security:
-        assert engine.hash_data(record) == bytes(
-            getattr(hashlib, algorithm)(
-                prefx00 +
-                data
-            ).hexdigest(),
-            encoding
-        )
-    else:
-        assert engine.hash_data(record) == bytes(
-            getattr(hashlib, algorithm)(data).hexdigest(),
-            encoding
+engine_params = []
+for (security, algorithm, encoding) in itertools.product(
+        (True, False),
+        ALGORITHMS,
+        ENCODINGS):
+    engine_id = f'{algorithm}-{encoding}-{int(security)}'
+    engine_params.append(
+        pytest.param(
+            (security, algorithm, encoding),
+            id=engine_id,
+            marks=pytest.mark.xdist_group(name=f'engine-{engine_id}')
         )
+    )
 
 
-@pytest.mark.parametrize("engine, algorithm, encoding, security",
-                         engines_types_encodings_securities)
-def test_single_bytes_hash(engine, algorithm, encoding, security):
-    prefx00 = '\x00'.encode(encoding)
-    data = record.encode(encoding)
+@pytest.fixture(scope='session', params=engine_params)
+def engine(request):
+    security, algorithm, encoding = request.param
+    return HashEngine(algorithm=algorithm, encoding=encoding,
+                      security=security)
 
-    if security:
-        assert engine.hash_data(data) == bytes(
-            getattr(hashlib, algorithm)(
-                bytes('\x00', encoding) +
-                data
-            ).hexdigest(),
-            encoding
-        )
-    else:
-        assert engine.hash_data(data) == bytes(
-            getattr(hashlib, algorithm)(data).hexdigest(),
-            encoding
-        )
 
+# Encoded record by (normalized) encoding
+ENC = {}
 
-@pytest.mark.parametrize("engine, algorithm, encoding, security",
-                         engines_types_encodings_securities)
-def test_double_bytes_hash(engine, algorithm, encoding, security):
-    prefx00 = '\x00'.encode(encoding)
-    prefx01 = '\x01'.encode(encoding)
-    data = record.encode(encoding)
-
-    if security:
-        assert engine.hash_pair(
-            data,
-            data) == bytes(
-            getattr(hashlib, algorithm)(
-                prefx01 +
-                data +
-                prefx01 +
-                data
-            ).hexdigest(),
-            encoding
-        )
-    else:
-        assert engine.hash_pair(
-            data,
-            data) == bytes(
-                getattr(hashlib, algorithm)(
-                    data +
-                    data
-                ).hexdigest(),
-                encoding
-        )
+# Expected digests of hash_data() over the record and of hash_pair() over the
+# record twice, computed once at import from the prefixed inputs, by
+# algorithm, (normalized) encoding and security mode
+EXPECTED = {}
 
+for encoding in ENCODINGS:
+    normalized = normalize_encoding(encoding)
+    data = ENC[normalized] = record.encode(encoding)
 
-# hash_path
+    for security in (True, False):
+        if security:
+            prefx00 = '\x00'.encode(encoding)
+            prefx01 = '\x01'.encode(encoding)
+        else:
+            prefx00 = prefx01 = b''
 
-@pytest.mark.parametrize('engine', engines)
-def test_0_elems_hash_path(engine):
-    with pytest.raises(EmptyPathException):
-        assert engine.hash_path((), 'anything')
+        prefixed0 = prefx00 + data
+        prefixed1 = prefx01 + data
 
+        for algorithm in ALGORITHMS:
+            hashf = getattr(hashlib, algorithm)
 
-@pytest.mark.parametrize('engine, record', engines_singleargs)
-def test_1_elems_hash_path(engine, record):
-    assert engine.hash_path(
-        ((+1, engine.hash_data(record)),), 0
-    ) == engine.hash_data(record)
-
-
-@pytest.mark.parametrize('engine', engines)
-def test_2_elems_hash_path(engine):
-    hashf = engine.hash_pair
-    hash_path = engine.hash_path
-    data = record.encode(engine.encoding)
-
-    if engine.security:
-        assert hash_path(
-            (
-                (
-                    +1,
-                    data
-                ),
-                (
-                    -1,
-                    data
-                )
-            ),
-            0
-        ) == hash_path(
-            (
-                (
-                    +1,
-                    data
-                ),
-                (
-                    -1,
-                    data
-                )
-            ),
-            1
-        ) == hashf(data, data)
-    else:
-        assert hash_path(
-            (
-                (
-                    +1,
-                    data
-                ),
-                (
-                    -1,
-                    data
-                )
-            ),
-            0
-        ) == hash_path(
-            (
-                (
-                    +1,
-                    data
-                ),
-                (
-                    -1,
-                    data
-                )
-            ),
-            1
-        ) == hashf(data, data)
-
-
-@pytest.mark.parametrize('engine', engines)
-def test_3_elems_hash_path_case_1(engine):
-    hashf = engine.hash_pair
-    hash_path = engine.hash_path
-    data = record.encode(engine.encoding)
-
-    if engine.security:
-        assert hash_path(
-            (
-                (
-                    +1,
-                    data
-                ),
-                (
-                    +1,
-                    data
-                ),
-                (
-                    'whatever',
-                    data
-                )
-            ),
-            0
-        ) == hash_path(
-            (
-                (
-                    +1,
-                    data
-                ),
-                (
-                    -1,
-                    data
-                ),
-                (
-                    'whatever',
-                    data
-                )
-            ),
-            1
-        ) == hashf(
-            hashf(
-                data,
-                data
-            ),
-            data
-        )
-    else:
-        assert hash_path(
-            (
-                (
-                    +1,
-                    data
-                ),
-                (
-                    +1,
-                    data
-                ),
-                (
-                    'whatever',
-                    data
-                )
-            ),
-            0
-
-        ) == hash_path(
-            (
-                (
-                    +1,
-                    data
-                ),
-                (
-                    -1,
-                    data
-                ),
-                (
-                    'whatever',
-                    data
-                )
-            ),
-            1
-        ) == hashf(
-            hashf(
-                data,
-                data),
-            data
-        )
+            # Feed the prefixed operand twice instead of concatenating
+            hasher = hashf(prefixed1)
+            hasher.update(prefixed1)
 
-
-@pytest.mark.parametrize('engine', engines)
-def test_3_elems_hash_path_case_2(engine):
-    hashf = engine.hash_pair
-    hash_path = engine.hash_path
-    data = record.encode(engine.encoding)
-
-    if engine.security:
-        assert hash_path(
-            (
-                (
-                    'whatever',
-                    data
-                ),
-                (
-                    -1,
-                    data
-                ),
-                (
-                    -1,
-                    data
-                )
-            ),
-            2
-        ) == hash_path(
-            (
-                (
-                    'whatever',
-                    data
-                ),
-                (
-                    +1,
-                    data
-                ),
-                (
-                    -1,
-                    data
-                )
-            ),
-            1
-        ) == hashf(
-            data,
-            hashf(
-                data,
-                data
-            )
-        )
-    else:
-        assert hash_path(
-            (
-                (
-                    'whatever',
-                    data
-                ),
-                (
-                    -1,
-                    data
-                ),
-                (
-                    -1,
-                    data
-                )
-            ),
-            2
-        ) == hash_path(
-            (
-                (
-                    'whatever',
-                    data
-                ),
-                (
-                    +1,
-                    data
-                ),
-                (
-                    -1,
-                    data
-                )
-            ),
-            1
-        ) == hashf(
-            data,
-            hashf(
-                data,
-                data
+            EXPECTED[algorithm, normalized, security] = (
+                hashf(prefixed0).hexdigest().encode(encoding),
+                hasher.hexdigest().encode(encoding),
             )
-        )
 
 
-@pytest.mark.parametrize('engine', engines)
-def test_4_elems_hash_path_edge_case_1(engine):
-    hashf = engine.hash_pair
-    hash_path = engine.hash_path
-    data = record.encode(engine.encoding)
-
-    if engine.security:
-        assert hash_path(
-            (
-                (
-                    +1,
-                    data
-                ),
-                (
-                    +1,
-                    data
-                ),
-                (
-                    +1,
-                    data
-                ),
-                (
-                    'whatever',
-                    data
-                )
-            ),
-            0
-        ) == hashf(
-            hashf(
-                hashf(
-                    data,
-                    data
-                ),
-                data
-            ),
-            data
-        )
-    else:
-        assert hash_path(
-            (
-                (
-                    +1,
-                    data
-                ),
-                (
-                    +1,
-                    data
-                ),
-                (
-                    +1,
-                    data
-                ),
-                (
-                    'whatever',
-                    data
-                )
-            ),
-            0
-        ) == hashf(
-            hashf(
-                hashf(
-                    data,
-                    data
-                ),
-                data
-            ),
-            data
-        )
+def encoded(engine):
+    return ENC[engine.encoding]
 
 
-@pytest.mark.parametrize('engine', engines)
-def test_4_elems_hash_path_edge_case_2(engine):
-    hashf = engine.hash_pair
-    hash_path = engine.hash_path
-    data = record.encode(engine.encoding)
-
-    if engine.security:
-        assert hash_path(
-            (
-                (
-                    'whatever',
-                    data
-                ),
-                (
-                    -1,
-                    data
-                ),
-                (
-                    -1,
-                    data
-                ),
-                (
-                    -1,
-                    data
-                )
-            ),
-            3
-        ) == hashf(
-            data,
-            hashf(
-                data,
-                hashf(
-                    data,
-                    data
-                )
-            )
-        )
-    else:
-        assert hash_path(
-            (
-                (
-                    'whatever',
-                    data
-                ),
-                (
-                    -1,
-                    data
-                ),
-                (
-                    -1,
-                    data
-                ),
-                (
-                    -1,
-                    data
-                )
-            ),
-            3
-        ) == hashf(
-            data,
-            hashf(
-                data,
-                hashf(
-                    data,
-                    data
-                )
-            )
-        )
+def expected(engine):
+    return EXPECTED[engine.algorithm, engine.encoding, engine.security]
 
 
-@pytest.mark.parametrize('engine', engines)
-def test_4_elems_hash_path(engine):
-    hashf = engine.hash_pair
-    hash_path = engine.hash_path
-    data = record.encode(engine.encoding)
-
-    if engine.security:
-        assert hash_path(
-            (
-                (
-                    +1,
-                    data
-                ),
-                (
-                    +1,
-                    data
-                ),
-                (
-                    -1,
-                    data
-                ),
-                (
-                    -1,
-                    data
-                )
-            ),
-            1
-        ) == hashf(
-            hashf(
-                data,
-                hashf(
-                    data,
-                    data)
-            ),
-            data
-        )
-    else:
-        assert hash_path(
-            (
-                (
-                    +1,
-                    data
-                ),
-                (
-                    +1,
-                    data
-                ),
-                (
-                    -1,
-                    data
-                ),
-                (
-                    -1,
-                    data
-                )
-            ),
-            1
-        ) == hashf(
-            hashf(
-                data,
-                hashf(
-                    data,
-                    data
-                )
-            ),
-            data
-        )
+# Cases of hash_path as (signs, offset, expected shape), the record being
+# hashed at every position of the path. Expected shapes are nested pairs
+# over the record D, each pair standing for a hash_pair application.
+D = 'record'
+
+HASH_PATH_CASES = [
+    ((+1, -1), 0, (D, D)),
+    ((+1, -1), 1, (D, D)),
+    ((+1, +1, 'whatever'), 0, ((D, D), D)),
+    ((+1, -1, 'whatever'), 1, ((D, D), D)),
+    (('whatever', -1, -1), 2, (D, (D, D))),
+    (('whatever', +1, -1), 1, (D, (D, D))),
+    ((+1, +1, +1, 'whatever'), 0, (((D, D), D), D)),
+    (('whatever', -1, -1, -1), 3, (D, (D, (D, D)))),
+    ((+1, +1, -1, -1), 1, ((D, (D, D)), D)),
+]
+
+PATHS = {encoding: {signs: tuple((sign, data) for sign in signs)
+                    for (signs, _, _) in HASH_PATH_CASES}
+         for (encoding, data) in ENC.items()}
+
+
+@pytest.fixture(scope='session')
+def shape_digests(engine):
+    # Expected digests by shape, computed once per engine; shared sub-shapes
+    # are evaluated only once
+    data = encoded(engine)
+    digests = {D: data}
+
+    def evaluate(shape):
+        try:
+            digest = digests[shape]
+        except KeyError:
+            left, right = shape
+            digest = digests[shape] = engine.hash_pair(evaluate(left),
+                                                       evaluate(right))
+        return digest
+
+    for (_, _, shape) in HASH_PATH_CASES:
+        evaluate(shape)
+
+    return digests
+
+
+# hash
+
+def test_single_string_hash(engine):
+    single, _ = expected(engine)
+    assert engine.hash_data(record) == single
+
+
+def test_single_bytes_hash(engine):
+    data = encoded(engine)
+    single, _ = expected(engine)
+    assert engine.hash_data(data) == single
+
+
+def test_double_bytes_hash(engine):
+    data = encoded(engine)
+    _, pair = expected(engine)
+    assert engine.hash_pair(data, data) == pair
+
+
+def test_hash_pairs_batch(engine):
+    data = encoded(engine)
+    pairs = [(data, data), (data, b''), (b'', data)]
+    assert engine.hash_pairs_batch(pairs) == [engine.hash_pair(left, right)
+                                              for (left, right) in pairs]
+
+
+@pytest.mark.parametrize('clone', (lambda engine: pickle.loads(
+    pickle.dumps(engine)), copy.deepcopy), ids=('pickle', 'deepcopy'))
+def test_clone_engine(engine, clone):
+    data = encoded(engine)
+    cloned = clone(engine)
+    assert cloned.hash_data(data) == engine.hash_data(data)
+    assert cloned.hash_pair(data, data) == engine.hash_pair(data, data)
+
+
+# hash_path
+
+def test_0_elems_hash_path(engine):
+    with pytest.raises(EmptyPathException):
+        assert engine.hash_path((), 'anything')
+
+
+def test_1_elems_hash_path(engine):
+    digest, _ = expected(engine)
+    assert engine.hash_path(((+1, digest),), 0) == digest
+
+
+@pytest.mark.parametrize('signs, offset, shape', HASH_PATH_CASES)
+def test_hash_path(engine, shape_digests, signs, offset, shape):
+    path = PATHS[engine.encoding][signs]
+
+    assert engine.hash_path(path, offset) == shape_digests[shape]
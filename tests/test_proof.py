@@ -6,6 +6,7 @@ import pytest
 import json
 
 from pymerkle import MerkleTree
+from pymerkle import prover
 from pymerkle.prover import Proof, PROOF_TEMPLATE, stringify_path
 
 
@@ -196,6 +197,16 @@ def test_serialization(proof, _serialization):
     assert proof.serialize() == _serialization
 
 
+@pytest.mark.parametrize('loader', ('json', 'orjson'))
+@pytest.mark.parametrize('proof', (proof_11, proof_21))
+def test_fromJSONText_with_either_loader(monkeypatch, proof, loader):
+    loads = pytest.importorskip(loader).loads
+    monkeypatch.setattr(prover, '_json_loads', loads)
+
+    assert Proof.fromJSONText(proof.toJSONText()).serialize() == \
+        proof.serialize()
+
+
 proof_13 = Proof.fromJSONText(proof_11.toJSONText())
 proof_23 = Proof.fromJSONText(proof_21.toJSONText())
 proof_14 = Proof.from_dict(json.loads(proof_11.toJSONText()))
@@ -52,3 +52,9 @@ def test_decompose_negative_convention():
 @pytest.mark.parametrize('num, powers', zip(nums, pows))
 def test_decompose(num, powers):
     assert utils.decompose(num) == list(reversed(powers))
+
+
+@pytest.mark.parametrize('power', (48, 53, 64, 100))
+def test_log_2_large_powers(power):
+    assert utils.log_2(2 ** power) == power and \
+        utils.log_2(2 ** power - 1) == power - 1
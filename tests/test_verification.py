@@ -22,16 +22,29 @@ def test_verify_proof_with_target():
     assert proof.verify() is proof.verify(target=proof.commitment)
 
 
+def test_verify_tampered_proof_after_valid_one():
+    tree = MerkleTree.init_from_records(
+        *[f'{i}-th record' for i in range(10)])
+    proof = tree.generate_audit_proof(tree.hash_data('3-th record'))
+    assert proof.verify()
+    sign, value = proof.path[0]
+    proof.path[0] = (sign, tree.hash_data('tampered'))
+    with pytest.raises(InvalidProof):
+        proof.verify()
+
+
 # Trees setup
 
 
 MAX_LENGTH = 4
 
+ENCODINGS = tuple(resolve_encodings(option))
+
 trees = []
 for security in (True, False):
     for length in range(1, MAX_LENGTH + 1):
         for algorithm in SUPPORTED_ALGORITHMS:
-            for encoding in resolve_encodings(option):
+            for encoding in ENCODINGS:
                 config = {'algorithm': algorithm, 'encoding': encoding,
                           'security': security}
                 tree = MerkleTree.init_from_records(
@@ -40,6 +53,10 @@ for security in (True, False):
                 trees.append(tree)
 
 
+def tree_id(tree):
+    return f'{tree.algorithm}-{tree.encoding}-{int(tree.security)}-{tree.length}'
+
+
 # Audit proof verification
 
 false_audit_proofs = []
@@ -62,13 +79,15 @@ for tree in trees:
         )
 
 
-@pytest.mark.parametrize('tree, proof', false_audit_proofs)
+@pytest.mark.parametrize('tree, proof', false_audit_proofs,
+                         ids=[tree_id(tree) for (tree, _) in false_audit_proofs])
 def test_false_audit_verify_proof(tree, proof):
     with pytest.raises(InvalidProof):
         proof.verify(target=tree.get_root_hash())
 
 
-@pytest.mark.parametrize('tree, proof', valid_audit_proofs)
+@pytest.mark.parametrize('tree, proof', valid_audit_proofs,
+                         ids=[tree_id(tree) for (tree, _) in valid_audit_proofs])
 def test_true_audit_verify_proof(tree, proof):
     assert proof.verify(target=tree.get_root_hash())
 
@@ -109,12 +128,14 @@ for (tree, subtree) in trees_and_subtrees:
     )
 
 
-@pytest.mark.parametrize('tree, proof', false_consistency_proofs)
+@pytest.mark.parametrize('tree, proof', false_consistency_proofs,
+                         ids=[tree_id(tree) for (tree, _) in false_consistency_proofs])
 def test_false_consistency_verify_proof(tree, proof):
     with pytest.raises(InvalidProof):
         proof.verify(target=tree.get_root_hash())
 
 
-@pytest.mark.parametrize('tree, proof', valid_consistency_proofs)
+@pytest.mark.parametrize('tree, proof', valid_consistency_proofs,
+                         ids=[tree_id(tree) for (tree, _) in valid_consistency_proofs])
 def test_true_consistency_verify_proof(tree, proof):
     assert proof.verify(target=tree.get_root_hash())
@@ -15,10 +15,12 @@ child_dir = os.path.dirname(os.path.dirname(__file__))
 short_APACHE_log = os.path.join(child_dir, 'logdata/short_APACHE_log')
 RED_HAT_LINUX_log = os.path.join(child_dir, 'logdata/RED_HAT_LINUX_log')
 
+ENCODINGS = tuple(resolve_encodings(option))
+
 trees_and_subtrees = []
 for security in (True, False):
     for algorithm in SUPPORTED_ALGORITHMS:
-        for encoding in resolve_encodings(option):
+        for encoding in ENCODINGS:
             config = {'algorithm': algorithm, 'encoding': encoding,
                       'security': security}
             tree = MerkleTree.init_from_records('a', 'b', 'c', 'd', 'e',
@@ -1,6 +1,8 @@
 import pytest
 import os
 import json
+import copy
+import pickle
 
 from pymerkle.tree import MerkleTree, UnsupportedParameter
 
@@ -43,3 +45,45 @@ def test_dimensions_of_empty_tree():
 def test_dimensions_of_tree_with_three_leaves():
     tree = MerkleTree.init_from_records('a', 'b', 'c')
     assert (tree.length, tree.size, tree.height) == (3, 5, 2)
+
+
+@pytest.mark.parametrize('length', range(0, 18))
+def test_init_from_records_coincides_with_encryption(length):
+    records = ['%d-th record' % i for i in range(length)]
+    tree = MerkleTree.init_from_records(*records)
+    expected = MerkleTree()
+    for record in records:
+        expected.encrypt(record)
+    assert tree.get_root_hash() == expected.get_root_hash() and \
+        (tree.length, tree.size, tree.height) == \
+        (expected.length, expected.size, expected.height)
+
+
+@pytest.mark.parametrize('length', range(1, 18))
+def test_encrypt_after_init_from_records(length):
+    records = ['%d-th record' % i for i in range(length + 1)]
+    tree = MerkleTree.init_from_records(*records[:-1])
+    tree.encrypt(records[-1])
+    assert tree.get_root_hash() == \
+        MerkleTree.init_from_records(*records).get_root_hash()
+
+
+def test_get_leaf():
+    tree = MerkleTree.init_from_records('a', 'b', 'c')
+    leaves = list(tree.get_leaves())
+    assert [tree.get_leaf(offset) for offset in range(3)] == leaves and \
+        tree.get_leaf(-1) is None and tree.get_leaf(3) is None and \
+        tree.get_tail() is leaves[-1] and leaves[0].next is leaves[1] and \
+        MerkleTree().get_tail() is None
+
+
+@pytest.mark.parametrize('clone', (lambda tree: pickle.loads(
+    pickle.dumps(tree)), copy.deepcopy), ids=('pickle', 'deepcopy'))
+def test_clone_tree(clone):
+    tree = MerkleTree.init_from_records(*[f'{i}-th record' for i in range(5)])
+    cloned = clone(tree)
+    assert cloned.get_root_hash() == tree.get_root_hash()
+
+    tree.encrypt('5-th record')
+    cloned.encrypt('5-th record')
+    assert cloned.get_root_hash() == tree.get_root_hash()
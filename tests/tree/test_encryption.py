@@ -7,10 +7,12 @@ from pymerkle.hashing import HashEngine, SUPPORTED_ALGORITHMS
 from tests.conftest import option, resolve_encodings
 
 
+ENCODINGS = tuple(resolve_encodings(option))
+
 trees_engines = []
 for security in (True, False):
     for algorithm in SUPPORTED_ALGORITHMS:
-        for encoding in resolve_encodings(option):
+        for encoding in ENCODINGS:
             config = {'algorithm': algorithm, 'encoding': encoding,
                       'security': security}
 
@@ -48,3 +48,12 @@ def test_fromJSONFile():
     tree.export(filepath=export_path)
 
     assert tree.serialize() == MerkleTree.fromJSONFile(export_path).serialize()
+
+
+def test_fromJSONFile_root_hash():
+    tree = MerkleTree.init_from_records(*['%d-th record' % i for i in range(13)])
+    export_path = os.path.join(exports_dir, '%s.json' % generate_uuid())
+    tree.export(filepath=export_path)
+
+    assert tree.get_root_hash() == \
+        MerkleTree.fromJSONFile(export_path).get_root_hash()
@@ -2,160 +2,135 @@
 Tests proof generation methods
 """
 
+import itertools
+
 import pytest
 
 from pymerkle import MerkleTree
-from pymerkle.hashing import SUPPORTED_ALGORITHMS
 
-from tests.conftest import option, resolve_encodings
+from tests.conftest import option, resolve_encodings, \
+    resolve_algorithms, normalize_encoding
 
 
 # Trees setup
 
 MAX_LENGTH = 4
-trees = []
-for security in (True, False):
-    for length in range(0, MAX_LENGTH + 1):
-        for algorithm in SUPPORTED_ALGORITHMS:
-            for encoding in resolve_encodings(option):
-                config = {'algorithm': algorithm, 'encoding': encoding,
-                          'security': security}
-                tree = MerkleTree.init_from_records(
-                    *['%d-th record' % _ for _ in range(length)],
-                    config=config)
-                trees.append(tree)
-
-
-tree__wrong_challenge = []
-tree_challenge = []
-
-for tree in trees:
-
-    tree__wrong_challenge.append(
-        (
-            tree,
-            b'anything that has not been recorded'
+
+ENCODINGS = tuple(resolve_encodings(option))
+ALGORITHMS = tuple(resolve_algorithms(option))
+
+RECORDS = [f'{i}-th record' for i in range(MAX_LENGTH)]
+
+# Records encoded once per (normalized) encoding
+ENC_RECORDS = {normalize_encoding(encoding): [record.encode(encoding)
+                                              for record in RECORDS]
+               for encoding in ENCODINGS}
+
+
+# Each tree, along with its challenges, is kept on one worker under
+# ``--dist loadgroup`` instead of being rebuilt on every worker
+tree_params = []
+for (security, length, algorithm, encoding) in itertools.product(
+        (True, False),
+        range(0, MAX_LENGTH + 1),
+        ALGORITHMS,
+        ENCODINGS):
+    tree_id = f'{algorithm}-{encoding}-{int(security)}-{length}'
+    tree_params.append(
+        pytest.param(
+            (security, length, algorithm, encoding),
+            id=tree_id,
+            marks=pytest.mark.xdist_group(name=f'tree-{tree_id}')
         )
     )
 
-    for i in range(tree.length):
-        tree_challenge.append(
-            (
-                tree,
-                tree.hash_data('%d-th record' % i)
-            )
-        )
 
+@pytest.fixture(scope='module', params=tree_params)
+def tree(request):
+    security, length, algorithm, encoding = request.param
+    config = {'algorithm': algorithm, 'encoding': encoding,
+              'security': security}
+    return MerkleTree.init_from_records(*RECORDS[:length], config=config)
+
+
+@pytest.fixture(scope='module')
+def audit_challenges(tree):
+    return [tree.hash_data(record)
+            for record in ENC_RECORDS[tree.encoding][:tree.length]]
+
+
+@pytest.fixture
+def audit_challenge(audit_challenges, position):
+    if position >= len(audit_challenges):
+        pytest.skip('challenge position beyond tree length')
+    return audit_challenges[position]
 
-@pytest.mark.parametrize('tree, challenge', tree__wrong_challenge)
-def test_empty_generate_audit_proof(tree, challenge):
-    proof = tree.generate_audit_proof(challenge)
 
-    assert proof.__dict__ == {
-        'uuid': proof.uuid,
-        'timestamp': proof.timestamp,
-        'created_at': proof.created_at,
-        'algorithm': tree.algorithm,
-        'encoding': tree.encoding,
-        'security': tree.security,
-        'commitment': proof.commitment,
-        'offset': -1,
-        'path': [],
-    }
-
-
-@pytest.mark.parametrize('tree, challenge', tree_challenge)
-def test_non_empty_generate_audit_proof(tree, challenge):
+def test_empty_generate_audit_proof(tree):
+    challenge = b'anything that has not been recorded'
     proof = tree.generate_audit_proof(challenge)
 
-    assert proof.__dict__ == {
-        'uuid': proof.uuid,
-        'timestamp': proof.timestamp,
-        'created_at': proof.created_at,
-        'algorithm': tree.algorithm,
-        'encoding': tree.encoding,
-        'security': tree.security,
-        'commitment': proof.commitment,
-        'offset': proof.offset,
-        'path': proof.path,
-    }
+    assert proof.algorithm == tree.algorithm
+    assert proof.encoding == tree.encoding
+    assert proof.security == tree.security
+    assert proof.commitment == tree.get_root_hash()
+    assert proof.offset == -1
+    assert proof.path == []
 
 
-# Consistency proof
+@pytest.mark.parametrize('position', range(MAX_LENGTH))
+def test_non_empty_generate_audit_proof(tree, audit_challenge):
+    proof = tree.generate_audit_proof(audit_challenge)
 
-trees_and_subtrees = []
+    assert proof.algorithm == tree.algorithm
+    assert proof.encoding == tree.encoding
+    assert proof.security == tree.security
+    assert proof.commitment == tree.get_root_hash()
+    assert proof.offset != -1 and proof.path
+    assert proof.verify()
 
-for tree in trees:
-    for sublength in range(1, tree.length + 1):
 
-        trees_and_subtrees.append(
-            (
-                tree,
-                MerkleTree.init_from_records(
-                    *['%d-th record' % _ for _ in range(sublength)],
-                    config=tree.get_config())
-            )
-        )
+# Consistency proof
 
+@pytest.fixture(scope='module')
+def consistency_challenges(tree):
+    # Root-hashes of successive previous states, obtained by growing a
+    # single tree instead of rebuilding one per state
+    subtree = MerkleTree(**tree.get_config())
+    challenges = []
+    for record in ENC_RECORDS[tree.encoding][:tree.length]:
+        subtree.encrypt(record)
+        challenges.append(subtree.get_root_hash())
 
-tree_challenge = []
+    return challenges
 
-for (tree, subtree) in trees_and_subtrees:
 
-    tree_challenge.append(
-        (
-            tree,
-            subtree.get_root_hash(),
-        )
-    )
+@pytest.fixture
+def consistency_challenge(consistency_challenges, position):
+    if position >= len(consistency_challenges):
+        pytest.skip('challenge position beyond tree length')
+    return consistency_challenges[position]
 
 
-@pytest.mark.parametrize('tree, challenge', tree_challenge)
-def test_non_empty_generate_consistency_proof(tree, challenge):
-    proof = tree.generate_consistency_proof(challenge)
+@pytest.mark.parametrize('position', range(MAX_LENGTH))
+def test_non_empty_generate_consistency_proof(tree, consistency_challenge):
+    proof = tree.generate_consistency_proof(consistency_challenge)
+
+    assert proof.algorithm == tree.algorithm
+    assert proof.encoding == tree.encoding
+    assert proof.security == tree.security
+    assert proof.commitment == tree.get_root_hash()
+    assert proof.offset != -1 and proof.path
+    assert proof.verify()
 
-    assert proof.__dict__ == {
-        'uuid': proof.uuid,
-        'timestamp': proof.timestamp,
-        'created_at': proof.created_at,
-        'algorithm': tree.algorithm,
-        'encoding': tree.encoding,
-        'security': tree.security,
-        'commitment': proof.commitment,
-        'offset': proof.offset,
-        'path': proof.path,
-    }
-
-
-@pytest.mark.parametrize('tree, challenge', tree_challenge)
-def test_empty_generate_consistency_proof_with_wrong_challenge(tree, challenge):
-    proof = tree.generate_consistency_proof(challenge)
 
-    assert proof.__dict__ == {
-        'uuid': proof.uuid,
-        'timestamp': proof.timestamp,
-        'created_at': proof.created_at,
-        'algorithm': tree.algorithm,
-        'encoding': tree.encoding,
-        'security': tree.security,
-        'commitment': proof.commitment,
-        'offset': proof.offset,
-        'path': proof.path,
-    }
-
-
-@pytest.mark.parametrize('tree, challenge', tree_challenge)
-def test_empty_generate_consistency_proof_with_wrong_challenge(tree, challenge):
+def test_empty_generate_consistency_proof_with_wrong_challenge(tree):
+    challenge = b'anything except for the right hash value'
     proof = tree.generate_consistency_proof(challenge)
 
-    assert proof.__dict__ == {
-        'uuid': proof.uuid,
-        'timestamp': proof.timestamp,
-        'created_at': proof.created_at,
-        'algorithm': tree.algorithm,
-        'encoding': tree.encoding,
-        'security': tree.security,
-        'commitment': proof.commitment,
-        'offset': proof.offset,
-        'path': proof.path,
-    }
+    assert proof.algorithm == tree.algorithm
+    assert proof.encoding == tree.encoding
+    assert proof.security == tree.security
+    assert proof.commitment == tree.get_root_hash()
+    assert proof.offset == -1
+    assert proof.path == []
@@ -9,6 +9,11 @@ from pymerkle import MerkleTree
 from pymerkle.hashing import HashEngine
 
 
+# Tests grow the same tree in sequence, so they must share a worker under
+# ``--dist loadgroup``
+pytestmark = pytest.mark.xdist_group(name='structure')
+
+
 tree = MerkleTree()
 hash_data = tree.hash_data
 hash_pair = tree.hash_pair